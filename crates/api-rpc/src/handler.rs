@@ -19,6 +19,11 @@ use semantica_core::port::job_repository::JobRepository;
 use semantica_core::port::{IdProvider, Maintenance, TimeProvider, TransactionalJobRepository};
 use std::sync::Arc;
 
+// logs.tail.v1 long-poll limits
+const MAX_TAIL_WAIT_MS: u64 = 30_000;
+const TAIL_POLL_INTERVAL_MS: u64 = 100;
+const MAX_CONCURRENT_TAIL_POLLS: usize = 64;
+
 /// RPC Handler with injected dependencies
 pub struct RpcHandler {
     tx_job_repo: Arc<dyn TransactionalJobRepository>,
@@ -27,6 +32,7 @@ pub struct RpcHandler {
     time_provider: Arc<dyn TimeProvider>,
     maintenance: Arc<dyn Maintenance>,
     rate_limiter: Arc<RateLimiter>,
+    tail_polls: Arc<tokio::sync::Semaphore>,
     start_time: std::time::Instant,
 }
 
@@ -56,6 +62,7 @@ impl RpcHandler {
             time_provider,
             maintenance,
             rate_limiter: Arc::new(RateLimiter::new(max_burst, rate_per_sec)),
+            tail_polls: Arc::new(tokio::sync::Semaphore::new(MAX_CONCURRENT_TAIL_POLLS)),
             start_time: std::time::Instant::now(),
         }
     }
@@ -136,41 +143,93 @@ impl RpcHandler {
     }
 
     /// logs.tail.v1
+    ///
+    /// With `wait_ms` > 0, blocks until new lines appear, the job state differs
+    /// from `since_state` (or from the first state read), the job reaches a
+    /// terminal state, or the wait expires (long-poll).
+    ///
+    /// At most MAX_CONCURRENT_TAIL_POLLS long-polls run at once; further callers
+    /// queue for a slot until their deadline and then return a snapshot.
     pub async fn tail_logs(
         &self,
         params: TailLogsRequest,
     ) -> Result<TailLogsResponse, ErrorObjectOwned> {
-        let job = self
-            .job_repo
-            .find_by_id(&params.job_id)
-            .await
-            .map_err(to_rpc_error)?
-            .ok_or_else(|| {
-                to_rpc_error(semantica_core::error::AppError::NotFound(format!(
-                    "Job {} not found",
-                    params.job_id
-                )))
-            })?;
+        let deadline = tokio::time::Instant::now() + tail_wait(params.wait_ms);
+        // lines=0 without a cursor can never return lines: skip the log read
+        let read_log = params.lines > 0 || params.since_line.is_some();
+        let mut seen_state = params.since_state.clone();
 
-        // Read log file if exists
-        let lines = if let Some(log_path) = &job.log_path {
-            std::fs::read_to_string(log_path)
+        // Held for the whole poll loop; queued callers do no I/O while waiting
+        let _permit = if params.wait_ms > 0 {
+            tokio::time::timeout_at(deadline, self.tail_polls.acquire())
+                .await
                 .ok()
-                .map(|content| {
-                    let all_lines: Vec<&str> = content.lines().collect();
-                    let start = all_lines.len().saturating_sub(params.lines);
-                    all_lines[start..].iter().map(|s| s.to_string()).collect()
-                })
-                .unwrap_or_default()
+                .and_then(Result::ok)
         } else {
-            vec![]
+            None
         };
 
-        Ok(TailLogsResponse {
-            job_id: params.job_id,
-            log_path: job.log_path,
-            lines,
-        })
+        let mut all_lines: Vec<String> = Vec::new();
+        let mut log_signature = None;
+        let mut first_total = None;
+
+        loop {
+            let job = self
+                .job_repo
+                .find_by_id(&params.job_id)
+                .await
+                .map_err(to_rpc_error)?
+                .ok_or_else(|| {
+                    to_rpc_error(semantica_core::error::AppError::NotFound(format!(
+                        "Job {} not found",
+                        params.job_id
+                    )))
+                })?;
+
+            let mut window = None;
+            let mut new_lines = false;
+            if read_log {
+                // Re-read only when the file's path, size or mtime changed
+                let signature = match job.log_path.as_deref() {
+                    Some(path) => read_log_signature(path).await,
+                    None => None,
+                };
+                if signature != log_signature {
+                    all_lines = match job.log_path.as_deref() {
+                        Some(path) if signature.is_some() => read_log_lines(path).await,
+                        _ => Vec::new(),
+                    };
+                    log_signature = signature;
+                }
+                let total = all_lines.len();
+                let tail = tail_window(total, params.lines, params.since_line);
+                let first_total = *first_total.get_or_insert(total);
+                new_lines = tail_has_new_lines(tail, params.since_line, total, first_total);
+                window = Some(tail);
+            }
+            let (start, end) = window.unwrap_or((0, 0));
+
+            let state = job.state.to_string();
+            let seen = seen_state.get_or_insert_with(|| state.clone());
+            let state_changed = *seen != state;
+            let terminal = matches!(
+                job.state,
+                JobState::Done | JobState::Failed | JobState::Superseded | JobState::Cancelled
+            );
+
+            if new_lines || state_changed || terminal || tokio::time::Instant::now() >= deadline {
+                all_lines.truncate(end);
+                return Ok(TailLogsResponse {
+                    job_id: params.job_id,
+                    log_path: job.log_path,
+                    lines: all_lines.split_off(start),
+                    state,
+                    next_line: window.map(|(_, end)| end),
+                });
+            }
+
+            tokio::time::sleep(std::time::Duration::from_millis(TAIL_POLL_INTERVAL_MS)).await;
+        }
     }
 
     /// admin.stats.v1
@@ -257,3 +316,147 @@ impl RpcHandler {
         })
     }
 }
+
+/// Long-poll duration for `wait_ms`, capped at MAX_TAIL_WAIT_MS
+fn tail_wait(wait_ms: u64) -> std::time::Duration {
+    std::time::Duration::from_millis(wait_ms.min(MAX_TAIL_WAIT_MS))
+}
+
+/// Line range `[start, end)` to return from a log of `total` lines
+///
+/// Without a cursor this is the last `lines` lines; with `since_line` it is up
+/// to `lines` lines after the cursor. `end` is the next cursor.
+fn tail_window(total: usize, lines: usize, since_line: Option<usize>) -> (usize, usize) {
+    match since_line {
+        Some(cursor) => {
+            let start = cursor.min(total);
+            (start, start.saturating_add(lines).min(total))
+        }
+        None => (total.saturating_sub(lines), total),
+    }
+}
+
+/// Whether a long-poll should wake for log output
+///
+/// With a cursor, any line after it is new. Without one the window is always
+/// the last N lines, so only growth past the first read (`first_total`) counts.
+fn tail_has_new_lines(
+    (start, end): (usize, usize),
+    since_line: Option<usize>,
+    total: usize,
+    first_total: usize,
+) -> bool {
+    match since_line {
+        Some(_) => start < end,
+        None => total > first_total,
+    }
+}
+
+/// Size and mtime of a job log file (missing/unreadable file → None)
+async fn read_log_signature(path: &str) -> Option<(u64, Option<std::time::SystemTime>)> {
+    let meta = tokio::fs::metadata(path).await.ok()?;
+    Some((meta.len(), meta.modified().ok()))
+}
+
+/// Read all lines of a job log file (missing/unreadable file → empty)
+async fn read_log_lines(path: &str) -> Vec<String> {
+    tokio::fs::read_to_string(path)
+        .await
+        .map(|content| content.lines().map(str::to_string).collect())
+        .unwrap_or_default()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_tail_window_last_lines() {
+        assert_eq!(tail_window(10, 3, None), (7, 10));
+        assert_eq!(tail_window(2, 50, None), (0, 2));
+        // lines=0 returns nothing but still reports the end cursor
+        assert_eq!(tail_window(10, 0, None), (10, 10));
+    }
+
+    #[test]
+    fn test_tail_window_since_line_cursor() {
+        assert_eq!(tail_window(10, 3, Some(4)), (4, 7));
+        assert_eq!(tail_window(10, 50, Some(4)), (4, 10));
+        // Cursor at or past the end: nothing new, cursor stays at the end
+        assert_eq!(tail_window(10, 3, Some(10)), (10, 10));
+        assert_eq!(tail_window(10, 3, Some(25)), (10, 10));
+        assert_eq!(tail_window(10, usize::MAX, Some(4)), (4, 10));
+    }
+
+    #[test]
+    fn test_tail_wait_is_capped() {
+        assert_eq!(tail_wait(0), std::time::Duration::ZERO);
+        assert_eq!(tail_wait(250), std::time::Duration::from_millis(250));
+        assert_eq!(
+            tail_wait(u64::MAX),
+            std::time::Duration::from_millis(MAX_TAIL_WAIT_MS)
+        );
+    }
+
+    #[test]
+    fn test_tail_has_new_lines_cursor() {
+        assert!(tail_has_new_lines(
+            tail_window(10, 50, Some(4)),
+            Some(4),
+            10,
+            10
+        ));
+        assert!(!tail_has_new_lines(
+            tail_window(10, 50, Some(10)),
+            Some(10),
+            10,
+            10
+        ));
+    }
+
+    #[test]
+    fn test_tail_has_new_lines_last_lines_waits_for_growth() {
+        // A non-empty log alone must not end the long-poll
+        assert!(!tail_has_new_lines(tail_window(10, 3, None), None, 10, 10));
+        assert!(tail_has_new_lines(tail_window(11, 3, None), None, 11, 10));
+        // Truncated/rotated log: not new output
+        assert!(!tail_has_new_lines(tail_window(2, 3, None), None, 2, 10));
+    }
+
+    #[tokio::test]
+    async fn test_read_log_signature_tracks_changes() {
+        let path = std::env::temp_dir().join(format!("semantica-sig-{}.log", std::process::id()));
+        let path_str = path.to_str().unwrap();
+
+        assert_eq!(read_log_signature(path_str).await, None);
+        tokio::fs::write(&path, "a\n").await.unwrap();
+        let first = read_log_signature(path_str).await;
+        assert_eq!(first.map(|(len, _)| len), Some(2));
+        assert_eq!(read_log_signature(path_str).await, first);
+
+        tokio::fs::write(&path, "a\nb\n").await.unwrap();
+        assert_ne!(read_log_signature(path_str).await, first);
+
+        tokio::fs::remove_file(&path).await.unwrap();
+    }
+
+    #[tokio::test]
+    async fn test_read_log_lines_follows_appends() {
+        let path = std::env::temp_dir().join(format!("semantica-tail-{}.log", std::process::id()));
+        let path_str = path.to_str().unwrap();
+
+        tokio::fs::write(&path, "a\nb\n").await.unwrap();
+        let lines = read_log_lines(path_str).await;
+        let (start, next_line) = tail_window(lines.len(), 50, Some(0));
+        assert_eq!(&lines[start..next_line], ["a", "b"]);
+
+        // Appended lines are returned from the previous next_line
+        tokio::fs::write(&path, "a\nb\nc\n").await.unwrap();
+        let lines = read_log_lines(path_str).await;
+        let (start, end) = tail_window(lines.len(), 50, Some(next_line));
+        assert_eq!(&lines[start..end], ["c"]);
+
+        tokio::fs::remove_file(&path).await.unwrap();
+        assert!(read_log_lines(path_str).await.is_empty());
+    }
+}
@@ -35,11 +35,23 @@ pub struct CancelResponse {
 }
 
 /// logs.tail.v1 - Tail job logs
+///
+/// `since_line` switches from "last N lines" to cursor mode (lines after the cursor).
+/// `wait_ms` > 0 long-polls until new lines, a state change, or timeout. Without
+/// `since_line`, "new lines" means the log grew after the call started.
+/// `since_state` sets the state the change is measured against.
 #[derive(Debug, Deserialize)]
 pub struct TailLogsRequest {
     pub job_id: String,
     #[serde(default = "default_lines")]
     pub lines: usize,
+    #[serde(default)]
+    pub since_line: Option<usize>,
+    #[serde(default)]
+    pub wait_ms: u64,
+    /// Last state the caller saw; the long-poll wakes as soon as the job differs
+    #[serde(default)]
+    pub since_state: Option<String>,
 }
 
 fn default_lines() -> usize {
@@ -51,6 +63,10 @@ pub struct TailLogsResponse {
     pub job_id: String,
     pub log_path: Option<String>,
     pub lines: Vec<String>,
+    pub state: String,
+    /// Cursor to pass as `since_line` on the next call (None when the log was
+    /// not read, i.e. `lines` = 0 without `since_line`)
+    pub next_line: Option<usize>,
 }
 
 /// admin.stats.v1 - Get system statistics
@@ -88,12 +88,16 @@ echo "✅ $COMPOSE_FILE 생성 완료"
 
 # 5. requirements.txt 확인/추가
 if [ -f "requirements.txt" ]; then
-    if ! grep -q "requests" requirements.txt; then
-        echo "requests>=2.31.0" >> requirements.txt
-        echo "✅ requirements.txt에 requests 추가"
+    if ! grep -q "httpx" requirements.txt; then
+        echo "httpx[http2]>=0.24.0" >> requirements.txt
+        echo "✅ requirements.txt에 httpx 추가"
+    fi
+    if ! grep -q "orjson" requirements.txt; then
+        echo "orjson>=3.8.0" >> requirements.txt
+        echo "✅ requirements.txt에 orjson 추가"
     fi
 else
-    echo "requests>=2.31.0" > requirements.txt
+    printf "httpx[http2]>=0.24.0\norjson>=3.8.0\n" > requirements.txt
     echo "✅ requirements.txt 생성"
 fi
 
@@ -2,11 +2,22 @@
 Semantica Task Engine - Python SDK
 JSON-RPC 2.0 클라이언트
 """
+import itertools
+import json
 import os
-import requests
-from typing import Dict, Any, Optional, List
+import httpx
+import orjson
+from typing import Dict, Any, Optional, List, Tuple
 
 
+def _dumps(obj: Any) -> bytes:
+    """JSON 인코딩 (orjson 우선, 64비트 초과 정수 등 orjson 미지원 값은 json으로 대체)"""
+    try:
+        # int 등 str이 아닌 dict 키는 json 모듈처럼 문자열로 변환
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
 class SemanticaTaskClient:
     """Semantica Task Engine JSON-RPC 클라이언트"""
     
@@ -16,23 +27,30 @@ class SemanticaTaskClient:
             url: RPC 엔드포인트 (기본값: http://127.0.0.1:9527)
         """
         self.url = url or os.getenv("SEMANTICA_RPC_URL", "http://127.0.0.1:9527")
-        self.request_id = 0
-        self.session = requests.Session()
+        self._counter = itertools.count(1)  # JSON-RPC 요청 id
+        # Keep-alive 커넥션 풀 재사용 (연속 RPC 호출 시 핸드셰이크 생략)
+        self.session = httpx.Client(
+            timeout=10.0,
+            headers={"Content-Type": "application/json"},
+            transport=httpx.HTTPTransport(
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+                retries=2,  # 연결 실패 시 재시도
+            ),
+        )
     
     def _call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """JSON-RPC 호출"""
-        self.request_id += 1
         payload = {
             "jsonrpc": "2.0",
-            "id": self.request_id,
+            "id": next(self._counter),
             "method": method,
             "params": params
         }
         
         try:
-            resp = self.session.post(self.url, json=payload, timeout=10)
+            resp = self.session.post(self.url, content=_dumps(payload))
             resp.raise_for_status()
-            result = resp.json()
+            result = orjson.loads(resp.content)
             
             if "error" in result:
                 raise SemanticaRpcError(
@@ -43,9 +61,71 @@ class SemanticaTaskClient:
             
             return result["result"]
         
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise SemanticaConnectionError(f"Connection failed: {e}")
     
+    def _call_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        JSON-RPC 배치 호출 (HTTP 요청 1회, 결과는 calls 순서대로 반환)
+        
+        Raises:
+            SemanticaBatchError: 일부 호출 실패 시 (results에 성공 결과/에러가 순서대로 담김)
+        """
+        if not calls:
+            return []
+        
+        payload = []
+        for method, params in calls:
+            payload.append({
+                "jsonrpc": "2.0",
+                "id": next(self._counter),
+                "method": method,
+                "params": params
+            })
+        
+        try:
+            resp = self.session.post(self.url, content=_dumps(payload))
+            resp.raise_for_status()
+            results = orjson.loads(resp.content)
+        except httpx.HTTPError as e:
+            raise SemanticaConnectionError(f"Connection failed: {e}")
+        
+        # 배치 전체가 거부되면 단일 에러 객체가 반환됨
+        if isinstance(results, dict):
+            error = results.get("error", {})
+            raise SemanticaRpcError(
+                code=error.get("code", -1),
+                message=error.get("message", "Unexpected non-batch response"),
+                data=error.get("data")
+            )
+        
+        # 응답 순서는 보장되지 않으므로 id로 매칭
+        by_id = {item.get("id"): item for item in results}
+        out = []
+        failed = False
+        for call in payload:
+            item = by_id.get(call["id"])
+            if item is None:
+                out.append(SemanticaRpcError(
+                    code=-1,
+                    message=f"Missing response for request id {call['id']}"
+                ))
+                failed = True
+            elif "error" in item:
+                out.append(SemanticaRpcError(
+                    code=item["error"]["code"],
+                    message=item["error"]["message"],
+                    data=item["error"].get("data")
+                ))
+                failed = True
+            else:
+                out.append(item["result"])
+        
+        # 일부만 실패해도 성공한 결과는 버리지 않고 에러에 담아 전달
+        if failed:
+            raise SemanticaBatchError(out)
+        return out
+    
     def enqueue(
         self,
         job_type: str,
@@ -75,6 +155,32 @@ class SemanticaTaskClient:
             "priority": priority
         })
     
+    def enqueue_batch(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 Job을 JSON-RPC 배치로 한 번에 등록
+        
+        Args:
+            jobs: enqueue() 인자와 같은 키를 가진 dict 리스트
+                  (job_type, queue, subject_key, payload, priority)
+        
+        Returns:
+            jobs 순서대로 [{"job_id": "uuid", "queue": "...", "state": "QUEUED"}, ...]
+        
+        Raises:
+            SemanticaBatchError: 일부 Job이 거부된 경우.
+                e.results에 등록된 Job은 결과 dict, 거부된 Job은 SemanticaRpcError
+        """
+        return self._call_batch([
+            ("dev.enqueue.v1", {
+                "job_type": job["job_type"],
+                "queue": job["queue"],
+                "subject_key": job["subject_key"],
+                "payload": job["payload"],
+                "priority": job.get("priority", 0)
+            })
+            for job in jobs
+        ])
+    
     def cancel(self, job_id: str) -> Dict[str, Any]:
         """
         Job 취소
@@ -134,3 +240,10 @@ class SemanticaRpcError(SemanticaError):
         super().__init__(f"RPC Error {code}: {message}")
 
 
+class SemanticaBatchError(SemanticaError):
+    """배치 호출 일부 실패 에러 (성공한 결과 포함)"""
+    
+    def __init__(self, results: List[Any]):
+        self.results = results  # calls 순서대로 결과 dict 또는 SemanticaRpcError
+        self.errors = [r for r in results if isinstance(r, SemanticaRpcError)]
+        super().__init__(f"{len(self.errors)} of {len(results)} batch calls failed")
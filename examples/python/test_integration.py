@@ -3,7 +3,7 @@ Semantica Task Engine - Integration Test
 Docker 환경에서 daemon 연동 테스트
 """
 import time
-from semantica_client import SemanticaTaskClient, SemanticaError
+from semantica_client import SemanticaTaskClient, SemanticaError, SemanticaBatchError
 
 
 def main():
@@ -24,24 +24,37 @@ def main():
     # 2. Job 등록
     print("\n[2] Enqueuing jobs...")
     jobs = []
-    for i in range(3):
-        try:
-            resp = client.enqueue(
-                job_type="TEST_JOB",
-                queue="default",
-                subject_key=f"test-file-{i}.py",
-                payload={
+    try:
+        # 배치 호출 1회로 전체 Job 등록 (HTTP 왕복 1번)
+        responses = client.enqueue_batch([
+            {
+                "job_type": "TEST_JOB",
+                "queue": "default",
+                "subject_key": f"test-file-{i}.py",
+                "payload": {
                     "path": f"test-file-{i}.py",
                     "action": "index",
                     "test_id": i
                 },
-                priority=i
-            )
-            job_id = resp["job_id"]
-            jobs.append(job_id)
-            print(f"  ✅ Job {i+1}: {job_id[:8]}... (state: {resp['state']})")
-        except SemanticaError as e:
-            print(f"  ❌ Failed to enqueue job {i+1}: {e}")
+                "priority": i
+            }
+            for i in range(3)
+        ])
+    except SemanticaBatchError as e:
+        # 일부 실패: 등록된 Job은 그대로 이어서 확인
+        print(f"  ⚠️  {e}")
+        responses = e.results
+    except SemanticaError as e:
+        print(f"  ❌ Failed to enqueue jobs: {e}")
+        responses = []
+    
+    for i, resp in enumerate(responses):
+        if isinstance(resp, SemanticaError):
+            print(f"  ❌ Job {i+1}: {resp}")
+            continue
+        job_id = resp["job_id"]
+        jobs.append(job_id)
+        print(f"  ✅ Job {i+1}: {job_id[:8]}... (state: {resp['state']})")
     
     # 3. 상태 확인
     print("\n[3] Checking stats...")
@@ -0,0 +1,35 @@
+"""JSON encoding with orjson and a stdlib fallback"""
+
+import json
+
+import orjson
+
+
+def dumps(obj, option: int = 0, default=None) -> bytes:
+    """Encode ``obj`` to JSON bytes like the stdlib would
+
+    Non-str dict keys are stringified. Values orjson rejects (e.g. integers
+    beyond 64 bits) fall back to ``json.dumps``.
+    """
+    try:
+        return orjson.dumps(obj, default=default, option=option | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(
+            _str_keys(obj),
+            default=default,
+            sort_keys=bool(option & orjson.OPT_SORT_KEYS),
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode()
+
+
+def _str_keys(obj):
+    # json.dumps cannot sort mixed str/int keys, so stringify them up front
+    if isinstance(obj, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key): _str_keys(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_str_keys(value) for value in obj]
+    return obj
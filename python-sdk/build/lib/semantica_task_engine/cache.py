@@ -0,0 +1,81 @@
+"""Client-side result cache for read-only RPC methods"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import orjson
+
+from ._json import dumps as _dumps
+
+# Per-method TTL in seconds. Only idempotent read methods belong here.
+CACHEABLE_METHODS = {
+    "admin.stats.v1": 0.5,
+    "logs.tail.v1": 0.2,
+}
+
+# Methods that change job state and make cached reads stale
+INVALIDATING_METHODS = frozenset({"dev.enqueue.v1", "dev.cancel.v1"})
+
+
+class _ResultCache:
+    """Time-windowed LRU cache keyed by (method, params)
+
+    Results are stored encoded, so every hit decodes a fresh copy that callers
+    may mutate freely. ``generation`` counts invalidations: a read only stores
+    its result if no invalidating call started or finished while it was in
+    flight.
+    """
+
+    def __init__(self, ttls: dict = CACHEABLE_METHODS, maxsize: int = 128):
+        self._ttls = ttls
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+
+    def is_cacheable(self, method: str) -> bool:
+        return method in self._ttls
+
+    @staticmethod
+    def _key(method: str, params: dict) -> tuple:
+        return (method, _dumps(params, option=orjson.OPT_SORT_KEYS, default=str))
+
+    def get(self, method: str, params: dict) -> Optional[Any]:
+        """Return cached result, or None on miss/expiry"""
+        key = self._key(method, params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, encoded = entry
+            if time.monotonic() - stored_at < self._ttls[method]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return orjson.loads(encoded)
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, method: str, params: dict, result: Any, generation: int) -> None:
+        """Store ``result`` unless the cache was invalidated since ``generation``"""
+        if generation != self.generation:
+            return
+        key = self._key(method, params)
+        self._entries[key] = (time.monotonic(), _dumps(result))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all entries and reject results of reads already in flight"""
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._entries),
+        }
@@ -18,34 +18,62 @@ async def main():
     async with SemanticaTaskClient(auto_start_daemon=True) as client:
         print("✅ Client connected (daemon auto-started if needed)")
         
-        # Job 등록
-        response = await client.enqueue(
-            EnqueueRequest(
-                job_type="AUTO_TEST",
-                queue="default",
-                subject_key="auto-test-1",
-                payload={"message": "Daemon was auto-started!"},
-                priority=0
-            )
+        # Job 등록 (독립적인 Job은 동시에 전송 → keep-alive 커넥션 풀 공유)
+        semaphore = asyncio.Semaphore(32)  # Daemon 과부하 방지용 동시 요청 상한
+        
+        async def submit(i: int):
+            async with semaphore:
+                return await client.enqueue(
+                    EnqueueRequest(
+                        job_type="AUTO_TEST",
+                        queue="default",
+                        subject_key=f"auto-test-{i}",
+                        payload={"message": "Daemon was auto-started!", "index": i},
+                        priority=0
+                    )
+                )
+        
+        results = await asyncio.gather(
+            *(submit(i) for i in range(1, 4)), return_exceptions=True
         )
+        responses = [r for r in results if not isinstance(r, BaseException)]
         
-        print(f"\n✅ Job enqueued:")
-        print(f"   ID: {response.job_id}")
-        print(f"   State: {response.state}")
-        print(f"   Queue: {response.queue}")
+        print(f"\n✅ Jobs enqueued: {len(responses)}/{len(results)}")
+        for response in responses:
+            print(f"   ID: {response.job_id} (state: {response.state}, queue: {response.queue})")
+        for error in (r for r in results if isinstance(r, BaseException)):
+            print(f"   ❌ {error}")
+        
+        # Job 처리 대기 (Daemon이 완료를 보고하는 즉시 반환)
+        states = await asyncio.gather(
+            *(client.wait_for_state(r.job_id, "DONE", timeout=10) for r in responses),
+            return_exceptions=True,
+        )
+        for response, state in zip(responses, states):
+            if isinstance(state, asyncio.TimeoutError):
+                state = "TIMEOUT"
+            print(f"   {response.job_id}: {state}")
         
         # 로그 조회
-        await asyncio.sleep(1)  # Job 처리 대기
+        async def tail(job_id: str):
+            async with semaphore:
+                return await client.tail_logs(job_id, lines=10)
         
-        logs = await client.tail_logs(response.job_id, lines=10)
-        print(f"\n📋 Job logs:")
-        for line in logs.lines:
-            print(f"   {line}")
+        all_logs = await asyncio.gather(*(tail(r.job_id) for r in responses))
+        for logs in all_logs:
+            print(f"\n📋 Job logs ({logs.job_id}):")
+            for line in logs.lines:
+                print(f"   {line}")
     
     print("\n✅ Example completed!")
     print("   (Daemon will be stopped automatically if we started it)")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # optional: pip install semantica-task-engine[speedups]
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
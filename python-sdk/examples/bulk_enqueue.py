@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Semantica SDK - Bulk Enqueue Example
+
+대량 Job을 제한된 동시성으로 스트리밍 등록하는 예제 (인덱서 등)
+"""
+
+import asyncio
+import time
+
+from semantica_task_engine import EnqueueRequest, SemanticaTaskClient
+
+
+async def file_jobs(count: int):
+    """Job 소스 (실제로는 파일 시스템 탐색 등)"""
+    for i in range(count):
+        yield EnqueueRequest(
+            job_type="INDEX_FILE",
+            queue="default",
+            subject_key=f"bulk/file-{i}.py",
+            payload={"path": f"bulk/file-{i}.py"},
+        )
+
+
+async def main():
+    print("🚀 Semantica SDK - Bulk Enqueue Example")
+    print("=" * 60)
+
+    async with SemanticaTaskClient() as client:
+        started = time.monotonic()
+        enqueued = 0
+
+        # Worker 8개 + bounded queue: 메모리 일정, Daemon 동시 요청 최대 8개
+        # Daemon 기본 rate limit(burst 200, 초당 100건)을 넘는 요청은
+        # THROTTLED(4003)로 거부되고 stream_enqueue가 backoff 후 재시도함
+        async for response in client.stream_enqueue(file_jobs(300), concurrency=8):
+            enqueued += 1
+            if enqueued % 50 == 0:
+                print(f"   {enqueued} jobs enqueued (last: {response.job_id})")
+
+        elapsed = time.monotonic() - started
+        print(f"\n✅ {enqueued} jobs in {elapsed:.2f}s ({enqueued / elapsed:.0f} jobs/s)")
+
+
+if __name__ == "__main__":
+    try:
+        import uvloop  # optional: pip install semantica-task-engine[speedups]
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -44,5 +44,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # optional: pip install semantica-task-engine[speedups]
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
@@ -36,10 +36,13 @@ async def main():
         print(f"     - State: {response.state}")
         print(f"     - Queue: {response.queue}\n")
 
-        # 3. Wait a bit
-        print("3. Waiting 2 seconds...")
-        await asyncio.sleep(2)
-        print("   ✓ Done\n")
+        # 3. Wait for the job to finish (returns as soon as the daemon reports it)
+        print("3. Waiting for job to finish...")
+        try:
+            state = await client.wait_for_state(response.job_id, "DONE", timeout=10)
+            print(f"   ✓ Job state: {state}\n")
+        except asyncio.TimeoutError:
+            print("   ⚠ Job still running after 10 seconds\n")
 
         # 4. Tail logs
         print("4. Fetching job logs...")
@@ -69,5 +72,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # optional: pip install semantica-task-engine[speedups]
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
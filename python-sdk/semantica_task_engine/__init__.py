@@ -5,22 +5,42 @@ A Python client for SemanticaTask Engine.
 
 __version__ = "0.1.0"
 
-from .client import SemanticaTaskClient
+from typing import TYPE_CHECKING
+
 from .types import (
     EnqueueRequest,
     EnqueueResponse,
     CancelResponse,
     TailLogsResponse,
+    StatsResponse,
 )
-from .errors import ConnectionError, RpcError
+from .errors import BatchError, ConnectionError, RpcError
+
+if TYPE_CHECKING:
+    from .client import SemanticaTaskClient, close_shared_pool
+
+# Client (httpx, daemon management) loads on first access, so importing
+# only types/errors stays lightweight.
+_LAZY_CLIENT_ATTRS = ("SemanticaTaskClient", "close_shared_pool")
+
+
+def __getattr__(name):
+    if name in _LAZY_CLIENT_ATTRS:
+        from . import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "SemanticaTaskClient",
+    "close_shared_pool",
     "EnqueueRequest",
     "EnqueueResponse",
     "CancelResponse",
     "TailLogsResponse",
+    "StatsResponse",
     "ConnectionError",
     "RpcError",
+    "BatchError",
     "__version__",
 ]
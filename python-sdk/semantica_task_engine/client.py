@@ -1,12 +1,54 @@
 """Semantica Client Implementation"""
 
+import asyncio
+import itertools
+import os
 import httpx
-from typing import Optional
+import orjson
+from functools import lru_cache
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional, Union
+from urllib.parse import urlsplit
 
-from .errors import ConnectionError, RpcError
-from .types import EnqueueRequest, EnqueueResponse, CancelResponse, TailLogsResponse
+from ._json import dumps as _dumps
+from .cache import INVALIDATING_METHODS, _ResultCache
+from .errors import BatchError, ConnectionError, RpcError
+from .types import (
+    EnqueueRequest,
+    EnqueueResponse,
+    CancelResponse,
+    TailLogsResponse,
+    StatsResponse,
+)
 from .daemon import DaemonManager
 
+# Constant JSON-RPC envelope prefix, encoded once
+_STATIC_PREFIX = b'{"jsonrpc":"2.0","id":'
+
+# Job states that never change again
+TERMINAL_STATES = frozenset({"DONE", "FAILED", "SUPERSEDED", "CANCELLED"})
+
+# Upper bound for a single logs.tail.v1 long-poll (seconds)
+_LONG_POLL_WAIT = 5.0
+
+# Request bodies above this size are zstd-compressed when compress_requests=True
+_COMPRESS_MIN_BYTES = 1024
+
+# End-of-stream marker for stream_enqueue queues
+_STREAM_DONE = object()
+
+# Daemon rate limiter rejection (RpcError code); stream_enqueue retries it
+# with exponential backoff between these bounds (seconds)
+_THROTTLED = 4003
+_THROTTLE_INITIAL_DELAY = 0.05
+_THROTTLE_MAX_DELAY = 1.0
+
+# Hosts for which SEMANTICA_RPC_UDS (Unix domain socket) may replace TCP
+_LOCAL_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
+
+# Process-wide pool for clients created with shared_pool=True
+_SHARED: Optional[httpx.AsyncClient] = None
+_SHARED_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
 
 class SemanticaTaskClient:
     """SemanticaTask Engine Client
@@ -28,30 +70,62 @@ class SemanticaTaskClient:
         self, 
         url: str = "http://127.0.0.1:9527", 
         timeout: float = 30.0,
-        auto_start_daemon: bool = True
+        auto_start_daemon: bool = True,
+        shared_pool: bool = False,
+        compress_requests: bool = False,
     ):
         """Initialize client
         
         Args:
-            url: RPC endpoint URL
+            url: RPC endpoint URL. ``unix:///path/to/rpc.sock`` connects over a
+                Unix domain socket; for local TCP URLs the ``SEMANTICA_RPC_UDS``
+                environment variable does the same.
             timeout: Request timeout in seconds
-            auto_start_daemon: Automatically start daemon if not running (default: True)
+            auto_start_daemon: Automatically start daemon if not running (default: True,
+                local TCP endpoints only; ignored for remote hosts and Unix sockets)
+            shared_pool: Use the process-wide connection pool instead of a
+                per-client one (default: False). See close_shared_pool().
+            compress_requests: zstd-compress request bodies over 1 KiB
+                (default: False). Requires the ``zstandard`` package and a daemon
+                that accepts ``Content-Encoding: zstd``.
         """
         self.url = url
         self.timeout = timeout
         self.auto_start_daemon = auto_start_daemon
+        self.shared_pool = shared_pool
         self._client: Optional[httpx.AsyncClient] = None
-        self._request_id = 0
+        self._counter = itertools.count(1)  # JSON-RPC request ids
         self._daemon_manager: Optional[DaemonManager] = None
+        self._cache = _ResultCache()
+        self._compressor = None
+        if compress_requests:
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ImportError(
+                    "compress_requests=True requires 'zstandard' "
+                    "(pip install semantica-task-engine[compression])"
+                ) from e
+            self._compressor = zstandard.ZstdCompressor(level=3)
         
-        # Extract port from URL
-        if ":" in url.split("//")[-1]:
-            port = int(url.split(":")[-1].split("/")[0])
-        else:
-            port = 9527
+        # Parse endpoint once
+        parsed = urlsplit(url)
+        self._host = parsed.hostname or "127.0.0.1"
+        self._port = parsed.port or 9527
         
-        if auto_start_daemon:
-            self._daemon_manager = DaemonManager(port=port, auto_start=True)
+        # Local daemon over a Unix domain socket skips the loopback TCP stack
+        self._uds: Optional[str] = None
+        if parsed.scheme == "unix":
+            self._uds = url[len("unix://"):]
+        elif self._host in _LOCAL_HOSTS:
+            self._uds = os.getenv("SEMANTICA_RPC_UDS")
+        if self._uds:
+            self._uds = os.path.expanduser(self._uds)
+        self._endpoint = "http://localhost/" if self._uds else url
+        
+        # A local daemon can only serve a loopback endpoint
+        if auto_start_daemon and not self._uds and self._host in _LOCAL_HOSTS:
+            self._daemon_manager = DaemonManager(port=self._port, auto_start=True)
 
     async def __aenter__(self):
         """Context manager entry"""
@@ -59,41 +133,141 @@ class SemanticaTaskClient:
         if self._daemon_manager:
             await self._daemon_manager.start_daemon()
         
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        if self._uses_shared_pool:
+            self._client = _get_shared_http_client()
+        else:
+            # Single pooled client per scope: keep-alive connections amortize handshakes across RPCs
+            self._client = _new_http_client(
+                httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60),
+                uds=self._uds,
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         if self._client:
-            await self._client.aclose()
+            # The shared pool outlives individual clients
+            if not self._uses_shared_pool:
+                await self._client.aclose()
             self._client = None
         
         # Stop daemon if we started it
         if self._daemon_manager:
             await self._daemon_manager.stop_daemon()
 
-    async def _request(self, method: str, params: dict) -> dict:
+    @property
+    def _uses_shared_pool(self) -> bool:
+        # The shared pool is TCP-only; Unix socket clients keep their own transport
+        return self.shared_pool and not self._uds
+
+    async def _request(self, method: str, params: dict, cache: bool = True) -> dict:
         """Send JSON-RPC request"""
         if not self._client:
             raise ConnectionError("Client not initialized. Use 'async with' context manager.")
 
-        self._request_id += 1
+        cacheable = cache and self._cache.is_cacheable(method)
+
+        # Serve idempotent reads from the short-lived cache
+        if cacheable:
+            cached = self._cache.get(method, params)
+            if cached is not None:
+                return cached
+        invalidating = method in INVALIDATING_METHODS
+        if invalidating:
+            self._cache.invalidate()
+        generation = self._cache.generation
+
+        try:
+            response = await self._post(_encode_call(next(self._counter), method, params))
+        finally:
+            # Invalidate again once the write has landed (or may have): reads
+            # sent before this point may carry pre-write state
+            if invalidating:
+                self._cache.invalidate()
+
+        result = self._unwrap(orjson.loads(response.content))
+        if cacheable:
+            self._cache.put(method, params, result, generation)
+        return result
+
+    async def _request_batch(self, calls: list[tuple[str, dict]]) -> list[dict]:
+        """Send JSON-RPC batch request (single HTTP round-trip)
+        
+        Results are returned in the same order as ``calls``.
+        
+        Raises:
+            BatchError: If any call fails; ``results`` keeps the successful
+                results alongside the per-call ``RpcError``
+        """
+        if not self._client:
+            raise ConnectionError("Client not initialized. Use 'async with' context manager.")
+
+        if not calls:
+            return []
+
+        ids = []
+        bodies = []
+        for method, params in calls:
+            request_id = next(self._counter)
+            ids.append(request_id)
+            bodies.append(_encode_call(request_id, method, params))
+
+        invalidating = any(method in INVALIDATING_METHODS for method, _ in calls)
+        if invalidating:
+            self._cache.invalidate()
+        try:
+            response = await self._post(b"[" + b",".join(bodies) + b"]")
+        finally:
+            if invalidating:
+                self._cache.invalidate()
+
+        data = orjson.loads(response.content)
 
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._request_id,
-            "method": method,
-            "params": params,
-        }
+        # Whole batch rejected (e.g. invalid request): server replies with a single object
+        if isinstance(data, dict):
+            self._unwrap(data)
+            raise RpcError(code=-1, message="Unexpected non-batch response")
+
+        # Demultiplex responses by id (server may reorder them)
+        by_id = {item.get("id"): item for item in data}
+        results = []
+        failed = False
+        for request_id in ids:
+            item = by_id.get(request_id)
+            try:
+                if item is None:
+                    raise RpcError(code=-1, message=f"Missing response for request id {request_id}")
+                results.append(self._unwrap(item))
+            except RpcError as e:
+                results.append(e)
+                failed = True
+        if failed:
+            raise BatchError(results)
+        return results
+
+    async def _post(self, body: bytes) -> httpx.Response:
+        """POST an encoded JSON-RPC body, compressing large bodies if enabled"""
+        headers = None
+        if self._compressor is not None and len(body) > _COMPRESS_MIN_BYTES:
+            body = self._compressor.compress(body)
+            headers = {"content-encoding": "zstd"}
 
         try:
-            response = await self._client.post(self.url, json=payload)
+            response = await self._client.post(
+                self._endpoint, content=body, headers=headers, timeout=self.timeout
+            )
             response.raise_for_status()
         except httpx.HTTPError as e:
             raise ConnectionError(f"HTTP error: {e}") from e
+        return response
 
-        data = response.json()
+    def cache_stats(self) -> dict:
+        """Return read-cache counters: hits, misses, hit_rate, size"""
+        return self._cache.stats()
 
+    @staticmethod
+    def _unwrap(data: dict) -> dict:
+        """Extract JSON-RPC result or raise RpcError"""
         # Check for JSON-RPC error
         if "error" in data:
             error = data["error"]
@@ -126,22 +300,155 @@ class SemanticaTaskClient:
             ... )
             >>> print(response.job_id)
         """
-        result = await self._request(
-            "dev.enqueue.v1",
-            {
-                "job_type": request.job_type,
-                "queue": request.queue,
-                "subject_key": request.subject_key,
-                "payload": request.payload,
-                "priority": request.priority,
-            },
-        )
+        result = await self._request("dev.enqueue.v1", _enqueue_params(request))
 
-        return EnqueueResponse(
-            job_id=result["job_id"],
-            state=result["state"],
-            queue=result["queue"],
-        )
+        return _enqueue_response(result)
+
+    async def enqueue_batch(self, requests: list[EnqueueRequest]) -> list[EnqueueResponse]:
+        """Enqueue multiple jobs in one JSON-RPC batch call
+        
+        Args:
+            requests: Job enqueue parameters
+            
+        Returns:
+            EnqueueResponse list in the same order as ``requests``
+            
+        Raises:
+            BatchError: If any job in the batch is rejected. ``results`` holds an
+                EnqueueResponse for each accepted job and an RpcError for each
+                rejected one, in request order
+            
+        Example:
+            >>> responses = await client.enqueue_batch(
+            ...     [
+            ...         EnqueueRequest(
+            ...             job_type="INDEX_FILE",
+            ...             queue="default",
+            ...             subject_key=path,
+            ...             payload={"path": path},
+            ...         )
+            ...         for path in ["a.py", "b.py"]
+            ...     ]
+            ... )
+            >>> print([r.job_id for r in responses])
+        """
+        try:
+            results = await self._request_batch(
+                [("dev.enqueue.v1", _enqueue_params(request)) for request in requests]
+            )
+        except BatchError as e:
+            raise BatchError([_enqueue_response(result) for result in e.results]) from e
+
+        return [_enqueue_response(result) for result in results]
+
+    async def stream_enqueue(
+        self,
+        requests: Union[AsyncIterable[EnqueueRequest], Iterable[EnqueueRequest]],
+        concurrency: int = 16,
+        max_retries: int = 10,
+    ) -> AsyncIterator[EnqueueResponse]:
+        """Enqueue a stream of jobs with bounded concurrency
+        
+        A fixed pool of ``concurrency`` workers pulls requests from a bounded
+        queue, so memory stays flat and the daemon sees at most ``concurrency``
+        in-flight calls however many jobs the source yields. Calls rejected by
+        the daemon's rate limiter (THROTTLED, 4003) are retried with
+        exponential backoff.
+        
+        Args:
+            requests: Sync or async iterable of job enqueue parameters
+            concurrency: Number of concurrent workers (default: 16)
+            max_retries: Retries per job while throttled (default: 10)
+        
+        Yields:
+            EnqueueResponse per job, in completion order
+            
+        Raises:
+            ValueError: If ``concurrency`` is less than 1
+            RpcError, ConnectionError: First failure. No new jobs are started;
+                responses for jobs already in flight are yielded before it is raised
+        
+        Example:
+            >>> async def jobs():
+            ...     for path in paths:
+            ...         yield EnqueueRequest(
+            ...             job_type="INDEX_FILE",
+            ...             queue="default",
+            ...             subject_key=path,
+            ...             payload={"path": path},
+            ...         )
+            >>> async for response in client.stream_enqueue(jobs()):
+            ...     print(response.job_id)
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        pending: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 4)
+        results: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 4)
+
+        async def produce():
+            try:
+                if hasattr(requests, "__aiter__"):
+                    async for request in requests:
+                        await pending.put(request)
+                else:
+                    for request in requests:
+                        await pending.put(request)
+            except Exception as e:
+                await results.put(e)
+                return
+            for _ in range(concurrency):
+                await pending.put(_STREAM_DONE)
+
+        async def enqueue_with_retry(request: EnqueueRequest) -> EnqueueResponse:
+            delay = _THROTTLE_INITIAL_DELAY
+            for _ in range(max_retries):
+                try:
+                    return await self.enqueue(request)
+                except RpcError as e:
+                    if e.code != _THROTTLED:
+                        raise
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _THROTTLE_MAX_DELAY)
+            return await self.enqueue(request)
+
+        async def work():
+            while True:
+                request = await pending.get()
+                if request is _STREAM_DONE:
+                    await results.put(_STREAM_DONE)
+                    return
+                try:
+                    await results.put(await enqueue_with_retry(request))
+                except Exception as e:
+                    await results.put(e)
+
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(work()) for _ in range(concurrency)]
+        error: Optional[Exception] = None
+        finished = 0
+        try:
+            while finished < concurrency:
+                item = await results.get()
+                if item is _STREAM_DONE:
+                    finished += 1
+                elif isinstance(item, Exception):
+                    if error is None:
+                        error = item
+                        # Stop feeding workers; in-flight jobs still report back
+                        tasks[0].cancel()
+                        while not pending.empty():
+                            pending.get_nowait()
+                        for _ in range(concurrency):
+                            pending.put_nowait(_STREAM_DONE)
+                else:
+                    yield item
+            if error is not None:
+                raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def cancel(self, job_id: str) -> CancelResponse:
         """Cancel a job
@@ -164,13 +471,29 @@ class SemanticaTaskClient:
             cancelled=result["cancelled"],
         )
 
-    async def tail_logs(self, job_id: str, lines: int = 50) -> TailLogsResponse:
+    async def tail_logs(
+        self,
+        job_id: str,
+        lines: int = 50,
+        since_line: Optional[int] = None,
+        wait_ms: int = 0,
+        since_state: Optional[str] = None,
+    ) -> TailLogsResponse:
         """Tail job logs
         
+        Results are cached client-side for a short window (200ms), except
+        long-poll calls (``wait_ms`` > 0).
+        
         Args:
             job_id: ID of the job
             lines: Number of lines to retrieve (default: 50)
-            
+            since_line: Return lines after this cursor instead of the last ``lines``
+                (pass the previous response's ``next_line``)
+            wait_ms: Long-poll: daemon waits up to this long for new lines or a
+                state change before replying (default: 0, reply immediately)
+            since_state: Last state the caller saw; the long-poll wakes as soon
+                as the job's state differs from it (default: the state at call time)
+        
         Returns:
             TailLogsResponse with log lines
             
@@ -179,11 +502,174 @@ class SemanticaTaskClient:
             >>> for line in response.lines:
             ...     print(line)
         """
-        result = await self._request("logs.tail.v1", {"job_id": job_id, "lines": lines})
+        params = {"job_id": job_id, "lines": lines}
+        if since_line is not None:
+            params["since_line"] = since_line
+        if wait_ms:
+            params["wait_ms"] = wait_ms
+        if since_state is not None:
+            params["since_state"] = since_state
+
+        result = await self._request("logs.tail.v1", params, cache=not wait_ms)
 
         return TailLogsResponse(
             job_id=result["job_id"],
             log_path=result.get("log_path"),
             lines=result.get("lines", []),
+            state=result.get("state"),
+            next_line=result.get("next_line"),
+        )
+
+    async def wait_for_state(self, job_id: str, target_state: str, timeout: float = 30.0) -> str:
+        """Wait until a job reaches a state
+        
+        Long-polls ``logs.tail.v1`` so the call returns as soon as the daemon
+        reports the transition, without client-side sleeps.
+        
+        Args:
+            job_id: ID of the job
+            target_state: State to wait for (e.g. "RUNNING", "DONE")
+            timeout: Maximum time to wait in seconds (default: 30.0)
+            
+        Returns:
+            ``target_state``, or the terminal state the job ended in instead
+            
+        Raises:
+            asyncio.TimeoutError: If no matching state within ``timeout``
+            RpcError: If the daemon does not report job state
+            
+        Example:
+            >>> state = await client.wait_for_state("job-123", "DONE", timeout=10)
+            >>> print(state)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # First call reads the current state without waiting; later calls
+        # long-poll for any change from the last state seen
+        seen_state: Optional[str] = None
+        wait_ms = 0
+
+        while True:
+            # lines=0: no log payload, the daemon skips reading the log file
+            response = await self.tail_logs(
+                job_id, lines=0, wait_ms=wait_ms, since_state=seen_state
+            )
+
+            if response.state is None:
+                raise RpcError(code=-1, message="Daemon does not report job state in logs.tail.v1")
+            if response.state == target_state or response.state in TERMINAL_STATES:
+                return response.state
+            seen_state = response.state
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError(
+                    f"Job {job_id} did not reach {target_state} within {timeout}s"
+                )
+            wait = min(remaining, _LONG_POLL_WAIT, self.timeout / 2)
+            wait_ms = max(int(wait * 1000), 1)
+
+    async def stats(self) -> StatsResponse:
+        """Get system statistics
+        
+        Results are cached client-side for a short window (500ms).
+        
+        Returns:
+            StatsResponse with job counts, DB size and uptime
+            
+        Example:
+            >>> stats = await client.stats()
+            >>> print(f"Queued: {stats.queued_jobs}")
+        """
+        result = await self._request("admin.stats.v1", {})
+
+        return StatsResponse(
+            total_jobs=result["total_jobs"],
+            queued_jobs=result["queued_jobs"],
+            running_jobs=result["running_jobs"],
+            done_jobs=result["done_jobs"],
+            failed_jobs=result["failed_jobs"],
+            db_size_bytes=result["db_size_bytes"],
+            uptime_seconds=result["uptime_seconds"],
+        )
+
+
+def _enqueue_params(request: EnqueueRequest) -> dict:
+    """Build dev.enqueue.v1 params"""
+    return {
+        "job_type": request.job_type,
+        "queue": request.queue,
+        "subject_key": request.subject_key,
+        "payload": request.payload,
+        "priority": request.priority,
+    }
+
+
+def _enqueue_response(result: Union[dict, RpcError]) -> Union[EnqueueResponse, RpcError]:
+    """Build EnqueueResponse from a dev.enqueue.v1 result, passing errors through"""
+    if isinstance(result, RpcError):
+        return result
+    return EnqueueResponse(result["job_id"], result["state"], result["queue"])
+
+
+def _new_http_client(limits: httpx.Limits, uds: Optional[str] = None) -> httpx.AsyncClient:
+    """Create a keep-alive pooled client with JSON-RPC default headers
+    
+    With ``uds``, requests go over that Unix domain socket instead of TCP.
+    TCP clients keep httpx's default transport so ``HTTP(S)_PROXY`` and
+    ``NO_PROXY`` are still honoured for remote daemons.
+    """
+    headers = {"connection": "keep-alive", "content-type": "application/json"}
+    if uds:
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(limits=limits, uds=uds),
+            headers=headers,
         )
+    return httpx.AsyncClient(limits=limits, headers=headers)
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, creating it on first use
+    
+    No await between check and create, so this is race-free within an event
+    loop. A pool bound to a previous loop (e.g. an earlier asyncio.run) is
+    replaced, since its connections cannot be used from the new loop.
+    """
+    global _SHARED, _SHARED_LOOP
+    loop = asyncio.get_running_loop()
+    if _SHARED is None or _SHARED.is_closed or _SHARED_LOOP is not loop:
+        _SHARED = _new_http_client(
+            httpx.Limits(max_keepalive_connections=128, max_connections=256, keepalive_expiry=120)
+        )
+        _SHARED_LOOP = loop
+    return _SHARED
+
 
+async def close_shared_pool() -> None:
+    """Close the process-wide connection pool
+    
+    Call once at application shutdown, from the loop that used the pool.
+    """
+    global _SHARED, _SHARED_LOOP
+    if _SHARED is not None:
+        client, _SHARED, _SHARED_LOOP = _SHARED, None, None
+        await client.aclose()
+
+
+@lru_cache(maxsize=32)
+def _encode_method(method: str) -> bytes:
+    """Pre-encode the ',"method":...,"params":' segment for a method"""
+    return b',"method":' + orjson.dumps(method) + b',"params":'
+
+
+def _encode_call(request_id: int, method: str, params: dict) -> bytes:
+    """Encode a JSON-RPC 2.0 request object from pre-encoded segments"""
+    return b"".join(
+        (
+            _STATIC_PREFIX,
+            str(request_id).encode(),
+            _encode_method(method),
+            _dumps(params),
+            b"}",
+        )
+    )
@@ -5,11 +5,18 @@ Automatically start/stop Semantica Daemon when needed.
 
 import asyncio
 import os
-import subprocess
+import shutil
+import stat
 import time
 from typing import Optional
 import httpx
 
+# Records the daemon PID so later client instances can reattach (one file per port)
+PID_FILE = "~/.semantica/daemon-{port}.pid"
+
+# Seconds to wait for a spawned daemon to answer JSON-RPC
+STARTUP_TIMEOUT = 30
+
 
 class DaemonManager:
     """Automatically manage Semantica Daemon lifecycle"""
@@ -22,35 +29,66 @@ class DaemonManager:
         """
         self.port = port
         self.auto_start = auto_start
-        self.process: Optional[subprocess.Popen] = None
-        self._started_by_us = False
+        self.pid_file = os.path.expanduser(PID_FILE.format(port=port))
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._probe_client: Optional[httpx.AsyncClient] = None
     
     async def is_daemon_running(self) -> bool:
         """Check if daemon is already running"""
+        # Reuse one client across polls so the readiness loop shares a single connection
+        if self._probe_client is None:
+            self._probe_client = httpx.AsyncClient(
+                timeout=2.0,
+                limits=httpx.Limits(max_keepalive_connections=2, keepalive_expiry=30),
+            )
+        
         try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                response = await client.post(
-                    f"http://localhost:{self.port}",
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "admin.stats.v1",
-                        "params": {}
-                    }
-                )
-                return response.status_code == 200
-        except (httpx.ConnectError, httpx.TimeoutException):
+            response = await self._probe_client.post(
+                f"http://localhost:{self.port}",
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "admin.stats.v1",
+                    "params": {}
+                }
+            )
+            return response.status_code == 200
+        except httpx.TransportError:
             return False
     
+    async def _tcp_probe(self) -> bool:
+        """Check whether the daemon port accepts TCP connections (no HTTP round-trip)"""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection("127.0.0.1", self.port), timeout=0.1
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+    
     async def start_daemon(self) -> bool:
         """Start daemon if not running
         
         Returns:
             True if daemon was started, False if already running
         """
-        # Check if already running
-        if await self.is_daemon_running():
-            return False
+        try:
+            return await self._start_daemon()
+        except BaseException:
+            # __aexit__ never runs when __aenter__ fails: release the probe client here
+            await self._close_probe_client()
+            raise
+    
+    async def _start_daemon(self) -> bool:
+        # Check if already running (a live PID file skips the HTTP probe)
+        if await self._tcp_probe():
+            if _read_live_pid(self.pid_file) is not None or await self.is_daemon_running():
+                return False
         
         if not self.auto_start:
             raise RuntimeError(
@@ -76,37 +114,71 @@ class DaemonManager:
         data_dir = os.path.expanduser("~/.semantica")
         os.makedirs(data_dir, exist_ok=True)
         
-        self.process = subprocess.Popen(
-            [daemon_path],
+        self.process = await asyncio.create_subprocess_exec(
+            daemon_path,
             env=env,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
             start_new_session=True  # Detach from parent
         )
         
-        self._started_by_us = True
+        with open(self.pid_file, "w") as f:
+            f.write(str(self.process.pid))
         
-        # Wait for daemon to be ready
-        for _ in range(30):  # 30 seconds timeout
-            await asyncio.sleep(0.5)
-            if await self.is_daemon_running():
-                return True
-        
-        raise RuntimeError(
-            f"Daemon failed to start within 30 seconds. "
-            f"Check logs at ~/.semantica/logs/"
-        )
+        # Wait for daemon to be ready (exponential backoff: 50ms -> 500ms)
+        # Cheap TCP probe first; confirm with JSON-RPC on the first open port
+        # and then once per 4 successful probes until the daemon answers.
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        delay = 0.05
+        tcp_ok = 0
+        try:
+            while time.monotonic() < deadline:
+                await asyncio.sleep(delay)
+                if await self._tcp_probe():
+                    tcp_ok += 1
+                    if tcp_ok % 4 == 1 and await self.is_daemon_running():
+                        return True
+                delay = min(delay * 2, 0.5)
+            
+            raise RuntimeError(
+                f"Daemon failed to start within {STARTUP_TIMEOUT} seconds. "
+                f"Check logs at ~/.semantica/logs/"
+            )
+        except BaseException:
+            # Don't orphan a hung child: the next client would spawn a duplicate
+            await self._terminate_process()
+            raise
     
     async def stop_daemon(self):
         """Stop daemon if we started it"""
-        if self.process and self._started_by_us:
-            self.process.terminate()
+        await self._close_probe_client()
+        await self._terminate_process()
+    
+    async def _terminate_process(self):
+        """Terminate the daemon we spawned and remove its PID file"""
+        if self.process:
+            # Awaitable wait: does not block the event loop
             try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+                self.process.terminate()
+            except ProcessLookupError:
+                pass  # Already exited
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
                 self.process.kill()
+                await self.process.wait()
+            
+            if _read_live_pid(self.pid_file, check_alive=False) == self.process.pid:
+                try:
+                    os.remove(self.pid_file)
+                except OSError:
+                    pass
             self.process = None
-            self._started_by_us = False
+    
+    async def _close_probe_client(self):
+        if self._probe_client is not None:
+            await self._probe_client.aclose()
+            self._probe_client = None
     
     def _find_daemon_binary(self) -> Optional[str]:
         """Find semantica daemon binary
@@ -119,44 +191,47 @@ class DaemonManager:
         """
         # 1. Environment variable
         if path := os.getenv("SEMANTICA_DAEMON_PATH"):
-            if os.path.isfile(path) and os.access(path, os.X_OK):
+            if _is_executable(path):
                 return path
         
         # 2. In PATH
-        for name in ["semantica", "semantica-daemon"]:
-            try:
-                result = subprocess.run(
-                    ["which", name],
-                    capture_output=True,
-                    text=True,
-                    timeout=1
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return result.stdout.strip()
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+        for name in ("semantica", "semantica-daemon"):
+            if path := shutil.which(name):
+                return path
         
-        # 3. Development build (release)
-        dev_paths = [
+        # 3. Development build (release), 4. Development build (debug)
+        dev_paths = (
             "target/release/semantica",
             "../target/release/semantica",
             "../../target/release/semantica",
-        ]
-        for path in dev_paths:
-            abs_path = os.path.abspath(path)
-            if os.path.isfile(abs_path) and os.access(abs_path, os.X_OK):
-                return abs_path
-        
-        # 4. Development build (debug)
-        debug_paths = [
             "target/debug/semantica",
             "../target/debug/semantica",
             "../../target/debug/semantica",
-        ]
-        for path in debug_paths:
+        )
+        for path in dev_paths:
             abs_path = os.path.abspath(path)
-            if os.path.isfile(abs_path) and os.access(abs_path, os.X_OK):
+            if _is_executable(abs_path):
                 return abs_path
         
         return None
 
+
+def _is_executable(path: str) -> bool:
+    """Check for an executable regular file with a single stat call"""
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
+    return stat.S_ISREG(mode) and bool(mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
+
+
+def _read_live_pid(pid_file: str, check_alive: bool = True) -> Optional[int]:
+    """Read a PID file; None if missing, invalid or (optionally) not running"""
+    try:
+        with open(pid_file) as f:
+            pid = int(f.read().strip())
+        if check_alive:
+            os.kill(pid, 0)  # Signal 0: existence check only
+    except (OSError, ValueError):
+        return None
+    return pid
@@ -26,3 +26,16 @@ class RpcError(SemanticaTaskError):
         self.data = data
         super().__init__(f"RPC error {code}: {message}")
 
+
+
+class BatchError(SemanticaTaskError):
+    """JSON-RPC batch with one or more failed calls
+
+    ``results`` holds one entry per call, in request order: the call's result
+    on success, or the ``RpcError`` it failed with.
+    """
+
+    def __init__(self, results: list[Any]):
+        self.results = results
+        self.errors = [r for r in results if isinstance(r, RpcError)]
+        super().__init__(f"{len(self.errors)} of {len(results)} batch calls failed")
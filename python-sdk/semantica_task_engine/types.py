@@ -1,8 +1,15 @@
 """SemanticaTask SDK Types"""
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Optional
 
+# Responses are immutable; __slots__ (Python 3.10+) drops the per-instance __dict__
+if sys.version_info >= (3, 10):
+    _response = dataclass(frozen=True, slots=True)
+else:
+    _response = dataclass(frozen=True)
+
 
 @dataclass
 class EnqueueRequest:
@@ -15,7 +22,7 @@ class EnqueueRequest:
     priority: int = 0
 
 
-@dataclass
+@_response
 class EnqueueResponse:
     """Job enqueue response"""
 
@@ -24,7 +31,7 @@ class EnqueueResponse:
     queue: str
 
 
-@dataclass
+@_response
 class CancelResponse:
     """Job cancel response"""
 
@@ -32,11 +39,25 @@ class CancelResponse:
     cancelled: bool
 
 
-@dataclass
+@_response
 class TailLogsResponse:
     """Tail logs response"""
 
     job_id: str
     log_path: Optional[str]
     lines: list[str]
+    state: Optional[str] = None
+    next_line: Optional[int] = None
+
+
+@_response
+class StatsResponse:
+    """System statistics response"""
 
+    total_jobs: int
+    queued_jobs: int
+    running_jobs: int
+    done_jobs: int
+    failed_jobs: int
+    db_size_bytes: int
+    uptime_seconds: int
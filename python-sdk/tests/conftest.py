@@ -0,0 +1,76 @@
+"""Shared fixtures for SDK tests"""
+
+import inspect
+import json
+
+import httpx
+import pytest
+
+from semantica_task_engine import RpcError, SemanticaTaskClient
+
+
+class MockDaemon:
+    """In-process JSON-RPC endpoint for SemanticaTaskClient tests
+
+    ``handler(call)`` receives each decoded request object (batch entries one
+    at a time) and returns its result. Raising ``RpcError`` produces a JSON-RPC
+    error reply. Handlers may be sync or async.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests: list[httpx.Request] = []
+        self.calls: list[dict] = []
+        self.client: SemanticaTaskClient
+
+    async def _reply(self, call: dict) -> dict:
+        self.calls.append(call)
+        try:
+            result = self.handler(call)
+            if inspect.isawaitable(result):
+                result = await result
+        except RpcError as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": call["id"],
+                "error": {"code": e.code, "message": e.message, "data": e.data},
+            }
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = request.content
+        if request.headers.get("content-encoding") == "zstd":
+            import zstandard
+
+            body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        payload = json.loads(body)
+
+        if isinstance(payload, list):
+            replies = [await self._reply(call) for call in payload]
+            # Reply out of order to exercise id-based demultiplexing
+            return httpx.Response(200, json=replies[::-1])
+        return httpx.Response(200, json=await self._reply(payload))
+
+
+@pytest.fixture
+async def mock_daemon():
+    """Factory: ``mock_daemon(handler, **client_kwargs)`` -> MockDaemon with ``.client``
+
+    The client is wired to the handler without starting a daemon and is
+    closed on teardown.
+    """
+    created = []
+
+    def make(handler, **client_kwargs) -> MockDaemon:
+        client_kwargs.setdefault("auto_start_daemon", False)
+        daemon = MockDaemon(handler)
+        daemon.client = SemanticaTaskClient(**client_kwargs)
+        daemon.client._client = httpx.AsyncClient(transport=httpx.MockTransport(daemon))
+        created.append(daemon)
+        return daemon
+
+    yield make
+
+    for daemon in created:
+        await daemon.client._client.aclose()
@@ -17,6 +17,7 @@ def test_imports():
         EnqueueResponse,
         CancelResponse,
         TailLogsResponse,
+        StatsResponse,
         ConnectionError,
         RpcError,
     )
@@ -27,6 +28,7 @@ def test_imports():
     assert EnqueueResponse is not None
     assert CancelResponse is not None
     assert TailLogsResponse is not None
+    assert StatsResponse is not None
     assert ConnectionError is not None
     assert RpcError is not None
 
@@ -82,3 +84,621 @@ def test_error_types():
     rpc_err2 = RpcError(code=5000, message="Server error", data={"detail": "info"})
     assert rpc_err2.data == {"detail": "info"}
 
+
+
+async def test_daemon_probe_client_reused():
+    """Test readiness probes share one HTTP client until stop"""
+    from semantica_task_engine.daemon import DaemonManager
+    
+    manager = DaemonManager(port=1, auto_start=False)
+    
+    assert await manager.is_daemon_running() is False
+    probe_client = manager._probe_client
+    assert probe_client is not None
+    
+    assert await manager.is_daemon_running() is False
+    assert manager._probe_client is probe_client
+    
+    await manager.stop_daemon()
+    assert manager._probe_client is None
+    assert probe_client.is_closed
+
+
+async def test_start_daemon_failure_closes_probe_client(tmp_path, monkeypatch):
+    """Test a failed start releases the probe client (__aexit__ never runs)"""
+    import asyncio
+    
+    from semantica_task_engine.daemon import DaemonManager
+    
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("SEMANTICA_DAEMON_PATH", raising=False)
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    monkeypatch.chdir(tmp_path)
+    
+    # Port is open but not a daemon: the HTTP probe runs, then no binary is found
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    manager = DaemonManager(port=server.sockets[0].getsockname()[1])
+    
+    with pytest.raises(RuntimeError, match="binary not found"):
+        await manager.start_daemon()
+    server.close()
+    await server.wait_closed()
+    
+    assert manager._probe_client is None
+
+
+def test_find_daemon_binary_from_env(tmp_path, monkeypatch):
+    """Test SEMANTICA_DAEMON_PATH must point at an executable file"""
+    from semantica_task_engine.daemon import DaemonManager
+    
+    binary = tmp_path / "semantica"
+    binary.write_text("#!/bin/sh\n")
+    binary.chmod(0o644)
+    monkeypatch.setenv("SEMANTICA_DAEMON_PATH", str(binary))
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    monkeypatch.chdir(tmp_path)
+    
+    manager = DaemonManager()
+    assert manager._find_daemon_binary() is None
+    
+    binary.chmod(0o755)
+    assert manager._find_daemon_binary() == str(binary)
+
+
+async def test_enqueue_batch_single_round_trip(mock_daemon):
+    """Test enqueue_batch sends one batch POST and demultiplexes by id"""
+    from semantica_task_engine import EnqueueRequest
+    
+    def handler(call):
+        params = call["params"]
+        return {"job_id": params["subject_key"], "state": "QUEUED", "queue": params["queue"]}
+    
+    daemon = mock_daemon(handler)
+    
+    responses = await daemon.client.enqueue_batch(
+        [
+            EnqueueRequest(job_type="TEST", queue="default", subject_key=f"k{i}", payload={})
+            for i in range(3)
+        ]
+    )
+    
+    assert len(daemon.requests) == 1
+    assert [call["method"] for call in daemon.calls] == ["dev.enqueue.v1"] * 3
+    assert [r.job_id for r in responses] == ["k0", "k1", "k2"]
+
+
+async def test_enqueue_batch_partial_failure_keeps_accepted_jobs(mock_daemon):
+    """Test a rejected job raises BatchError carrying the accepted responses"""
+    from semantica_task_engine import BatchError, EnqueueRequest, EnqueueResponse, RpcError
+    
+    def handler(call):
+        params = call["params"]
+        if params["subject_key"] == "k1":
+            raise RpcError(4001, "Invalid parameter")
+        return {"job_id": params["subject_key"], "state": "QUEUED", "queue": params["queue"]}
+    
+    daemon = mock_daemon(handler)
+    
+    with pytest.raises(BatchError) as exc_info:
+        await daemon.client.enqueue_batch(
+            [
+                EnqueueRequest(job_type="TEST", queue="default", subject_key=f"k{i}", payload={})
+                for i in range(3)
+            ]
+        )
+    
+    results = exc_info.value.results
+    assert isinstance(results[0], EnqueueResponse) and results[0].job_id == "k0"
+    assert isinstance(results[1], RpcError) and results[1].code == 4001
+    assert isinstance(results[2], EnqueueResponse) and results[2].job_id == "k2"
+    assert exc_info.value.errors == [results[1]]
+
+
+async def test_read_cache_hits_and_invalidation(mock_daemon):
+    """Test stats() is served from cache until a state-changing call"""
+    
+    def handler(call):
+        if call["method"] == "dev.cancel.v1":
+            return {"job_id": "job-1", "cancelled": True}
+        return {
+            "total_jobs": 1,
+            "queued_jobs": 1,
+            "running_jobs": 0,
+            "done_jobs": 0,
+            "failed_jobs": 0,
+            "db_size_bytes": 4096,
+            "uptime_seconds": 3,
+        }
+    
+    daemon = mock_daemon(handler)
+    client = daemon.client
+    
+    stats = await client.stats()
+    assert stats.queued_jobs == 1
+    await client.stats()
+    assert [call["method"] for call in daemon.calls] == ["admin.stats.v1"]
+    
+    await client.cancel("job-1")
+    await client.stats()
+    
+    methods = [call["method"] for call in daemon.calls]
+    assert methods == ["admin.stats.v1", "dev.cancel.v1", "admin.stats.v1"]
+    assert client.cache_stats()["hits"] == 1
+    assert client.cache_stats()["misses"] == 2
+
+
+async def test_read_cached_during_write_is_invalidated(mock_daemon):
+    """Test a read cached while a cancel is in flight is dropped when it returns"""
+    import asyncio
+
+    released = asyncio.Event()
+    queued = iter([1, 0])
+
+    async def handler(call):
+        if call["method"] == "dev.cancel.v1":
+            await released.wait()
+            return {"job_id": "job-1", "cancelled": True}
+        return {
+            "total_jobs": 1,
+            "queued_jobs": next(queued),
+            "running_jobs": 0,
+            "done_jobs": 0,
+            "failed_jobs": 0,
+            "db_size_bytes": 4096,
+            "uptime_seconds": 3,
+        }
+
+    client = mock_daemon(handler).client
+
+    cancel = asyncio.ensure_future(client.cancel("job-1"))
+    await asyncio.sleep(0)
+    assert (await client.stats()).queued_jobs == 1
+    released.set()
+    await cancel
+
+    assert (await client.stats()).queued_jobs == 0
+
+
+async def test_read_sent_before_write_is_not_cached(mock_daemon):
+    """Test a read that returns after a write finished does not cache old state"""
+    import asyncio
+    
+    queued = 1
+    stats_read = asyncio.Event()
+    release_stats = asyncio.Event()
+    
+    async def handler(call):
+        nonlocal queued
+        if call["method"] == "dev.cancel.v1":
+            queued = 0
+            return {"job_id": "job-1", "cancelled": True}
+        snapshot = queued
+        if not stats_read.is_set():
+            # Server reads the pre-cancel state, reply is delayed past the cancel
+            stats_read.set()
+            await release_stats.wait()
+        return {
+            "total_jobs": 1,
+            "queued_jobs": snapshot,
+            "running_jobs": 0,
+            "done_jobs": 0,
+            "failed_jobs": 0,
+            "db_size_bytes": 4096,
+            "uptime_seconds": 3,
+        }
+    
+    client = mock_daemon(handler).client
+    
+    stale = asyncio.ensure_future(client.stats())
+    await stats_read.wait()
+    await client.cancel("job-1")
+    release_stats.set()
+    assert (await stale).queued_jobs == 1
+    
+    assert (await client.stats()).queued_jobs == 0
+
+
+async def test_cached_results_are_independent_copies(mock_daemon):
+    """Test mutating a returned result does not corrupt later cache hits"""
+    daemon = mock_daemon(
+        lambda call: {"job_id": "job-1", "log_path": None, "lines": ["a", "b"], "state": "DONE"}
+    )
+    client = daemon.client
+    
+    first = await client.tail_logs("job-1")
+    first.lines.append("mutated")
+    second = await client.tail_logs("job-1")
+    second.lines.clear()
+    
+    assert (await client.tail_logs("job-1")).lines == ["a", "b"]
+    assert len(daemon.calls) == 1
+
+
+async def test_daemon_tcp_probe():
+    """Test TCP probe reports whether the daemon port is bound"""
+    import asyncio
+    
+    from semantica_task_engine.daemon import DaemonManager
+    
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    
+    assert await DaemonManager(port=port)._tcp_probe() is True
+    
+    server.close()
+    await server.wait_closed()
+    assert await DaemonManager(port=port)._tcp_probe() is False
+
+
+def test_encode_call_matches_jsonrpc_envelope():
+    """Test pre-encoded request body is a valid JSON-RPC 2.0 object"""
+    import orjson
+    from semantica_task_engine.client import _encode_call
+    
+    body = _encode_call(7, "logs.tail.v1", {"job_id": "job-1", "lines": 10})
+    
+    assert orjson.loads(body) == {
+        "jsonrpc": "2.0",
+        "id": 7,
+        "method": "logs.tail.v1",
+        "params": {"job_id": "job-1", "lines": 10},
+    }
+
+
+def test_encode_call_handles_non_str_keys_and_big_ints():
+    """Test params orjson rejects natively still encode like json.dumps"""
+    import json
+
+    from semantica_task_engine.cache import _ResultCache
+    from semantica_task_engine.client import _encode_call
+
+    params = {"payload": {1: "a", "big": 2**70}}
+
+    body = _encode_call(7, "dev.enqueue.v1", params)
+
+    assert json.loads(body)["params"] == {"payload": {"1": "a", "big": 2**70}}
+    key = _ResultCache._key("logs.tail.v1", params)[1]
+    assert key == b'{"payload":{"1":"a","big":1180591620717411303424}}'
+
+
+async def test_wait_for_state_long_polls_until_target(mock_daemon):
+    """Test wait_for_state long-polls logs.tail.v1 until the target state"""
+    states = iter(["QUEUED", "RUNNING", "DONE"])
+    
+    def handler(call):
+        return {
+            "job_id": "job-1",
+            "log_path": None,
+            "lines": [],
+            "state": next(states),
+            "next_line": 0,
+        }
+    
+    daemon = mock_daemon(handler)
+    
+    state = await daemon.client.wait_for_state("job-1", "DONE", timeout=10)
+    
+    assert state == "DONE"
+    params = [call["params"] for call in daemon.calls]
+    assert len(params) == 3
+    # First call reads the state without waiting, then long-polls from the last state seen
+    assert "wait_ms" not in params[0] and "since_state" not in params[0]
+    assert [p["since_state"] for p in params[1:]] == ["QUEUED", "RUNNING"]
+    assert all(p["wait_ms"] > 0 and p["lines"] == 0 for p in params[1:])
+
+
+async def test_wait_for_state_returns_immediately_when_already_in_target(mock_daemon):
+    """Test a job already in a non-terminal target state costs one non-blocking call"""
+    daemon = mock_daemon(
+        lambda call: {"job_id": "job-1", "log_path": None, "lines": [], "state": "RUNNING"}
+    )
+
+    assert await daemon.client.wait_for_state("job-1", "RUNNING", timeout=10) == "RUNNING"
+    assert len(daemon.calls) == 1
+    assert "wait_ms" not in daemon.calls[0]["params"]
+
+
+def test_client_url_parsing():
+    """Test host/port extraction from the RPC URL"""
+    from semantica_task_engine import SemanticaTaskClient
+    
+    client = SemanticaTaskClient("http://localhost:7701/rpc", auto_start_daemon=True)
+    assert client._host == "localhost"
+    assert client._port == 7701
+    assert client._daemon_manager.port == 7701
+    
+    client = SemanticaTaskClient("http://example.com/", auto_start_daemon=True)
+    assert client._host == "example.com"
+    assert client._port == 9527
+    # Remote endpoint: never start a local daemon
+    assert client._daemon_manager is None
+
+
+async def test_stop_daemon_awaits_process_and_removes_pid_file(tmp_path, monkeypatch):
+    """Test stop_daemon terminates the child without blocking and cleans PID file"""
+    import asyncio
+    import os
+    
+    from semantica_task_engine.daemon import DaemonManager
+    
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (tmp_path / ".semantica").mkdir()
+    pid_file = tmp_path / ".semantica" / "daemon-9527.pid"
+    other_port = tmp_path / ".semantica" / "daemon-9528.pid"
+    other_port.write_text(str(os.getpid()))
+    
+    manager = DaemonManager()
+    assert manager.pid_file == str(pid_file)
+    process = await asyncio.create_subprocess_exec("sleep", "30")
+    manager.process = process
+    pid_file.write_text(str(process.pid))
+    
+    await manager.stop_daemon()
+    
+    assert process.returncode is not None
+    assert manager.process is None
+    assert not pid_file.exists()
+    # Another port's daemon is left alone
+    assert other_port.exists()
+
+
+async def test_start_daemon_timeout_terminates_child(tmp_path, monkeypatch):
+    """Test a daemon that never becomes ready is stopped and its PID file removed"""
+    import socket
+    
+    from semantica_task_engine import daemon as daemon_module
+    
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(daemon_module, "STARTUP_TIMEOUT", 0.3)
+    hung = tmp_path / "semantica"
+    hung.write_text("#!/bin/sh\nexec sleep 30\n")
+    hung.chmod(0o755)
+    monkeypatch.setenv("SEMANTICA_DAEMON_PATH", str(hung))
+    
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    manager = daemon_module.DaemonManager(port=port)
+    
+    with pytest.raises(RuntimeError, match="failed to start"):
+        await manager.start_daemon()
+    
+    assert manager.process is None
+    assert not (tmp_path / ".semantica" / f"daemon-{port}.pid").exists()
+
+
+async def test_shared_pool_reused_across_clients():
+    """Test shared_pool clients share one AsyncClient that survives __aexit__"""
+    from semantica_task_engine import SemanticaTaskClient, close_shared_pool
+    
+    async with SemanticaTaskClient(auto_start_daemon=False, shared_pool=True) as first:
+        shared = first._client
+    async with SemanticaTaskClient(auto_start_daemon=False, shared_pool=True) as second:
+        assert second._client is shared
+    
+    assert not shared.is_closed
+    await close_shared_pool()
+    assert shared.is_closed
+
+
+async def test_unix_socket_transport(tmp_path):
+    """Test unix:// URLs send JSON-RPC over a Unix domain socket"""
+    import asyncio
+    import json
+    
+    from semantica_task_engine import SemanticaTaskClient
+    
+    async def handle(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = next(
+            int(line.split(b":")[1])
+            for line in head.split(b"\r\n")
+            if line.lower().startswith(b"content-length:")
+        )
+        call = json.loads(await reader.readexactly(length))
+        body = json.dumps(
+            {"jsonrpc": "2.0", "id": call["id"], "result": {"job_id": "job-1", "cancelled": True}}
+        ).encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+        )
+        await writer.drain()
+        writer.close()
+    
+    sock_path = tmp_path / "rpc.sock"
+    server = await asyncio.start_unix_server(handle, path=str(sock_path))
+    
+    client = SemanticaTaskClient(f"unix://{sock_path}")
+    assert client._daemon_manager is None
+    async with client:
+        response = await client.cancel("job-1")
+    
+    server.close()
+    await server.wait_closed()
+    assert response.cancelled is True
+
+
+async def test_tcp_client_honours_proxy_env(monkeypatch):
+    """Test TCP clients keep env proxy support (remote daemons behind a proxy)"""
+    import httpx
+    from semantica_task_engine.client import _new_http_client
+    
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.local:3128")
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.local:3128")
+    
+    client = _new_http_client(httpx.Limits())
+    assert client._mounts
+    await client.aclose()
+
+
+def test_response_types_are_immutable():
+    """Test response dataclasses are frozen (and slotted on 3.10+)"""
+    import dataclasses
+    import sys
+    
+    from semantica_task_engine import EnqueueResponse
+    
+    resp = EnqueueResponse("job-1", "QUEUED", "default")
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        resp.state = "DONE"
+    if sys.version_info >= (3, 10):
+        assert not hasattr(resp, "__dict__")
+
+
+async def test_compress_large_request_bodies(mock_daemon):
+    """Test compress_requests zstd-encodes bodies over 1 KiB only"""
+    pytest.importorskip("zstandard")
+    from semantica_task_engine import EnqueueRequest
+    
+    daemon = mock_daemon(
+        lambda call: {"job_id": "job-1", "state": "QUEUED", "queue": "default"},
+        compress_requests=True,
+    )
+    
+    small = EnqueueRequest(job_type="T", queue="default", subject_key="s", payload={})
+    large = EnqueueRequest(job_type="T", queue="default", subject_key="l", payload="x" * 4096)
+    await daemon.client.enqueue(small)
+    await daemon.client.enqueue(large)
+    
+    assert daemon.requests[0].headers.get("content-encoding") is None
+    assert daemon.requests[1].headers.get("content-encoding") == "zstd"
+    assert daemon.calls[1]["params"]["payload"] == "x" * 4096
+
+
+def test_package_import_does_not_load_httpx():
+    """Test importing types keeps httpx unloaded until the client is used"""
+    import os
+    import subprocess
+    import sys
+    
+    code = (
+        "import sys\n"
+        "from semantica_task_engine import EnqueueRequest\n"
+        "assert 'httpx' not in sys.modules\n"
+        "from semantica_task_engine import SemanticaTaskClient\n"
+        "assert 'httpx' in sys.modules\n"
+    )
+    sdk_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=sdk_root)
+
+
+async def test_concurrent_requests_get_unique_ids(mock_daemon):
+    """Test request ids stay unique across concurrent and batched calls"""
+    import asyncio
+    
+    daemon = mock_daemon(lambda call: {"job_id": "j", "cancelled": True})
+    client = daemon.client
+    
+    await asyncio.gather(*(client.cancel(f"job-{i}") for i in range(10)))
+    await client._request_batch(
+        [("dev.cancel.v1", {"job_id": "a"}), ("dev.cancel.v1", {"job_id": "b"})]
+    )
+    
+    ids = [call["id"] for call in daemon.calls]
+    assert len(ids) == 12
+    assert len(set(ids)) == 12
+
+
+async def test_stream_enqueue_bounds_concurrency(mock_daemon):
+    """Test stream_enqueue yields every response with bounded in-flight calls"""
+    import asyncio
+    
+    from semantica_task_engine import EnqueueRequest
+    
+    in_flight = 0
+    peak = 0
+    
+    async def handler(call):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return {"job_id": call["params"]["subject_key"], "state": "QUEUED", "queue": "default"}
+    
+    async def jobs():
+        for i in range(50):
+            yield EnqueueRequest(job_type="T", queue="default", subject_key=f"k{i}", payload={})
+    
+    daemon = mock_daemon(handler)
+    
+    job_ids = [r.job_id async for r in daemon.client.stream_enqueue(jobs(), concurrency=4)]
+    
+    assert sorted(job_ids) == sorted(f"k{i}" for i in range(50))
+    assert peak <= 4
+
+
+async def test_stream_enqueue_retries_throttled_calls(mock_daemon, monkeypatch):
+    """Test THROTTLED (4003) rejections are retried instead of ending the stream"""
+    from semantica_task_engine import EnqueueRequest, RpcError
+    from semantica_task_engine import client as client_module
+
+    monkeypatch.setattr(client_module, "_THROTTLE_INITIAL_DELAY", 0.001)
+    attempts = {}
+
+    def handler(call):
+        key = call["params"]["subject_key"]
+        attempts[key] = attempts.get(key, 0) + 1
+        # Every job is rejected twice before the limiter lets it through
+        if attempts[key] <= 2:
+            raise RpcError(4003, "Too many requests")
+        return {"job_id": key, "state": "QUEUED", "queue": "default"}
+
+    jobs = [
+        EnqueueRequest(job_type="T", queue="default", subject_key=f"k{i}", payload={})
+        for i in range(20)
+    ]
+    daemon = mock_daemon(handler)
+
+    job_ids = [r.job_id async for r in daemon.client.stream_enqueue(jobs, concurrency=4)]
+
+    assert sorted(job_ids) == sorted(f"k{i}" for i in range(20))
+    assert set(attempts.values()) == {3}
+
+
+async def test_stream_enqueue_yields_accepted_jobs_before_error(mock_daemon):
+    """Test a failure still yields responses for jobs already accepted"""
+    import asyncio
+
+    from semantica_task_engine import EnqueueRequest, RpcError
+
+    async def handler(call):
+        key = call["params"]["subject_key"]
+        if key == "k0":
+            raise RpcError(4001, "Invalid parameter")
+        # In flight when k0 fails
+        await asyncio.sleep(0.01)
+        return {"job_id": key, "state": "QUEUED", "queue": "default"}
+
+    jobs = [
+        EnqueueRequest(job_type="T", queue="default", subject_key=f"k{i}", payload={})
+        for i in range(50)
+    ]
+    daemon = mock_daemon(handler)
+
+    job_ids = []
+    with pytest.raises(RpcError) as exc_info:
+        async for response in daemon.client.stream_enqueue(jobs, concurrency=4):
+            job_ids.append(response.job_id)
+
+    assert exc_info.value.code == 4001
+    # Every job the daemon accepted is reported, and no new jobs start after the error
+    keys = [call["params"]["subject_key"] for call in daemon.calls]
+    accepted = [key for key in keys if key != "k0"]
+    assert sorted(job_ids) == sorted(accepted)
+    assert len(daemon.calls) < 50
+
+
+async def test_stream_enqueue_rejects_non_positive_concurrency(mock_daemon):
+    """Test concurrency < 1 raises instead of silently dropping every job"""
+    from semantica_task_engine import EnqueueRequest
+
+    daemon = mock_daemon(lambda call: {"job_id": "j", "state": "QUEUED", "queue": "default"})
+    jobs = [EnqueueRequest(job_type="T", queue="default", subject_key="k", payload={})]
+
+    with pytest.raises(ValueError):
+        async for _ in daemon.client.stream_enqueue(jobs, concurrency=0):
+            pass
+    assert daemon.calls == []